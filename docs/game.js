@@ -21,27 +21,43 @@ function parseFloat_(s) {
 function parseHHMM(s) {
     if (!s || typeof s !== 'string') return null;
     s = s.trim();
+    const n = s.length;
+    let i = 0;
+
+    // Hours: one or more digits, read straight from char codes
+    let h = 0;
+    for (; i < n; i++) {
+        const d = s.charCodeAt(i) - 48;
+        if (d < 0 || d > 9) break;
+        h = h * 10 + d;
+    }
+    if (i === 0 || i === n) return null;
+
     // Accept either : or . as separator (. is easier on mobile keyboards)
-    let hh, mm;
-    if (s.includes(':')) {
-        [hh, mm] = s.split(':');
-    } else if (s.includes('.')) {
-        [hh, mm] = s.split('.');
-    } else {
-        return null;
+    const sep = s.charCodeAt(i);
+    if (sep !== 58 && sep !== 46) return null;
+    const mStart = ++i;
+
+    // Minutes: one or more digits running to the end of the string
+    let m = 0;
+    for (; i < n; i++) {
+        const d = s.charCodeAt(i) - 48;
+        if (d < 0 || d > 9) return null;
+        m = m * 10 + d;
     }
-    if (!/^\d+$/.test(hh) || !/^\d+$/.test(mm)) return null;
-    const h = parseInt(hh, 10);
-    const m = parseInt(mm, 10);
-    if (h < 0 || h > 23 || m < 0 || m > 59) return null;
+    if (i === mStart || h > 23 || m > 59) return null;
     return h * 60 + m;
 }
 
-function fmtHHMM(minutes) {
-    minutes = ((minutes % (24 * 60)) + 24 * 60) % (24 * 60);
+// Every minute of the day pre-formatted as HH:MM
+const HHMM_STRINGS = Array.from({ length: 24 * 60 }, (_, minutes) => {
     const h = Math.floor(minutes / 60);
     const m = minutes % 60;
     return `${h.toString().padStart(2, '0')}:${m.toString().padStart(2, '0')}`;
+});
+
+function fmtHHMM(minutes) {
+    return HHMM_STRINGS[((minutes % (24 * 60)) + 24 * 60) % (24 * 60)];
 }
 
 function randInt(min, max) {
@@ -56,9 +72,43 @@ function randChoice(arr) {
     return arr[Math.floor(Math.random() * arr.length)];
 }
 
-function randSample(arr, n) {
-    const shuffled = [...arr].sort(() => Math.random() - 0.5);
-    return shuffled.slice(0, n);
+// Two distinct items without copying or shuffling the array
+function randPair(arr) {
+    const n = arr.length;
+    const i = Math.floor(Math.random() * n);
+    let j = Math.floor(Math.random() * (n - 1));
+    if (j >= i) j++;
+    return [arr[i], arr[j]];
+}
+
+// Error metrics shared by every generated problem. Both arguments are
+// already numbers (parser output and correctValue), so nothing is coerced.
+function absDiff(u, t) {
+    return Math.abs(u - t);
+}
+
+function minuteDiff(u, t) {
+    const d = Math.abs(u - t);
+    return d <= 720 ? d : 1440 - d;
+}
+
+// Dense src x dst table over a fixed name list. Names map to small integer
+// ids and each pair packs into one index (src * n + dst) of a typed array.
+function buildPairTable(names, fn) {
+    const n = names.length;
+    const ids = {};
+    names.forEach((name, i) => { ids[name] = i; });
+    const values = new Float64Array(n * n);
+    for (let i = 0; i < n; i++) {
+        for (let j = 0; j < n; j++) {
+            values[i * n + j] = fn(names[i], names[j]);
+        }
+    }
+    return { ids, n, values };
+}
+
+function pairLookup(table, src, dst) {
+    return table.values[table.ids[src] * table.n + table.ids[dst]];
 }
 
 function roundTo(num, decimals) {
@@ -81,11 +131,17 @@ const TIMEZONES = {
     'NPT': 5 * 60 + 45,
 };
 
+const TIMEZONE_NAMES = Object.keys(TIMEZONES);
+
+// Forward shift in minutes (0..1439) for every src -> dst zone pair
+const TIMEZONE_DELTA = buildPairTable(TIMEZONE_NAMES, (src, dst) => {
+    const delta = TIMEZONES[dst] - TIMEZONES[src];
+    return ((delta % (24 * 60)) + 24 * 60) % (24 * 60);
+});
+
+// hhmmSrc is minutes since midnight (0..1439), so one modulo suffices
 function convertTimezone(hhmmSrc, src, dst) {
-    const offsetSrc = TIMEZONES[src];
-    const offsetDst = TIMEZONES[dst];
-    const delta = offsetDst - offsetSrc;
-    return ((hhmmSrc + delta) % (24 * 60) + 24 * 60) % (24 * 60);
+    return (hhmmSrc + pairLookup(TIMEZONE_DELTA, src, dst)) % (24 * 60);
 }
 
 // ============================================
@@ -127,82 +183,126 @@ const NUMBER_FACTORS = {
     'billion': 1000000000.0,
 };
 
+// Precomputed src -> dst ratios so each conversion is one lookup + multiply
+function buildRatioTable(factors) {
+    return buildPairTable(Object.keys(factors), (src, dst) => factors[src] / factors[dst]);
+}
+
+const LENGTH_RATIOS = buildRatioTable(LENGTH_FACTORS);
+const MASS_RATIOS = buildRatioTable(MASS_FACTORS);
+const VOLUME_RATIOS = buildRatioTable(VOLUME_FACTORS);
+const NUMBER_RATIOS = buildRatioTable(NUMBER_FACTORS);
+
 function convertLength(value, src, dst) {
-    return value * LENGTH_FACTORS[src] / LENGTH_FACTORS[dst];
+    return value * pairLookup(LENGTH_RATIOS, src, dst);
 }
 
 function convertMass(value, src, dst) {
-    return value * MASS_FACTORS[src] / MASS_FACTORS[dst];
+    return value * pairLookup(MASS_RATIOS, src, dst);
 }
 
 function convertVolume(value, src, dst) {
-    return value * VOLUME_FACTORS[src] / VOLUME_FACTORS[dst];
+    return value * pairLookup(VOLUME_RATIOS, src, dst);
 }
 
-function convertTemp(value, src, dst) {
-    if (src === dst) return value;
-    // Normalize to Celsius
-    let c;
-    if (src === 'C') c = value;
-    else if (src === 'F') c = (value - 32) * 5 / 9;
-    else if (src === 'K') c = value - 273.15;
-    else throw new Error('Unknown temp unit');
+// Each temp unit as an affine map to / from Celsius: c = v * scale + offset
+const TEMP_TO_C = {
+    'C': { scale: 1, offset: 0 },
+    'F': { scale: 5 / 9, offset: -32 * 5 / 9 },
+    'K': { scale: 1, offset: -273.15 },
+};
 
-    // From Celsius to dst
-    if (dst === 'C') return c;
-    if (dst === 'F') return c * 9 / 5 + 32;
-    if (dst === 'K') return c + 273.15;
-    throw new Error('Unknown temp unit');
+const TEMP_FROM_C = {
+    'C': { scale: 1, offset: 0 },
+    'F': { scale: 9 / 5, offset: 32 },
+    'K': { scale: 1, offset: 273.15 },
+};
+
+// Composed src -> dst affine maps, so a conversion is one multiply-add
+const TEMP_SCALE = buildPairTable(TEMP_UNITS, (src, dst) =>
+    src === dst ? 1 : TEMP_TO_C[src].scale * TEMP_FROM_C[dst].scale);
+const TEMP_OFFSET = buildPairTable(TEMP_UNITS, (src, dst) =>
+    src === dst ? 0 : TEMP_TO_C[src].offset * TEMP_FROM_C[dst].scale + TEMP_FROM_C[dst].offset);
+
+function convertTemp(value, src, dst) {
+    const si = TEMP_SCALE.ids[src];
+    const di = TEMP_SCALE.ids[dst];
+    if (si === undefined || di === undefined) throw new Error('Unknown temp unit');
+    const k = si * TEMP_SCALE.n + di;
+    return value * TEMP_SCALE.values[k] + TEMP_OFFSET.values[k];
 }
 
 function convertNumber(value, src, dst) {
-    return value * NUMBER_FACTORS[src] / NUMBER_FACTORS[dst];
+    return value * pairLookup(NUMBER_RATIOS, src, dst);
+}
+
+// Unit lists per category, built once instead of per generated problem
+const UNITS_BY_CATEGORY = {
+    'length': Object.keys(LENGTH_FACTORS),
+    'mass': Object.keys(MASS_FACTORS),
+    'volume': Object.keys(VOLUME_FACTORS),
+    'temp': TEMP_UNITS,
+    'number': Object.keys(NUMBER_FACTORS),
+};
+
+// Build a unit config, intersecting allowed units with each category once
+function makeUnitConfig(enabledCategories, allowedUnits) {
+    const filteredUnits = {};
+    for (const category of Object.keys(allowedUnits)) {
+        const allowed = allowedUnits[category];
+        filteredUnits[category] = (UNITS_BY_CATEGORY[category] || []).filter(u => allowed.has(u));
+    }
+    return { enabledCategories, allowedUnits, filteredUnits };
 }
 
 // Helper to get units for a category with optional filtering
 function getUnitsForCategory(category, unitConfig) {
-    const allUnits = {
-        'length': Object.keys(LENGTH_FACTORS),
-        'mass': Object.keys(MASS_FACTORS),
-        'volume': Object.keys(VOLUME_FACTORS),
-        'temp': TEMP_UNITS,
-        'number': Object.keys(NUMBER_FACTORS),
-    };
-    const available = allUnits[category] || [];
-    if (unitConfig && unitConfig.allowedUnits && unitConfig.allowedUnits[category]) {
-        const allowed = unitConfig.allowedUnits[category];
-        return available.filter(u => allowed.has(u));
-    }
-    return available;
+    const available = UNITS_BY_CATEGORY[category] || [];
+    if (!unitConfig) return available;
+    return unitConfig.filteredUnits[category] || available;
 }
 
 // ============================================
 // DIFFICULTY CALCULATIONS
 // ============================================
 
-function arithmeticDifficulty(op, a, b) {
-    const digits = (x) => Math.max(1, Math.floor(Math.log10(Math.abs(x) + 1)) + 1);
+// difficulty ** k tabulated over [1, 6] in 0.05 steps; lookups interpolate
+// linearly (relative error under 2e-4) and fall back to Math.pow out of range
+const POW_TABLE_MIN = 1.0;
+const POW_TABLE_STEP = 0.05;
+const POW_TABLE_SIZE = 101;
 
-    let decs = 0;
-    [a, b].forEach(x => {
-        const s = x.toString();
-        if (s.includes('.')) {
-            decs += s.split('.')[1].length;
-        }
-    });
+function buildPowTable(k) {
+    return Float64Array.from({ length: POW_TABLE_SIZE }, (_, i) => Math.pow(POW_TABLE_MIN + i * POW_TABLE_STEP, k));
+}
+
+const POW_0_8 = buildPowTable(0.8);
+const POW_1_1 = buildPowTable(1.1);
+const POW_1_3 = buildPowTable(1.3);
+
+function difficultyPow(table, k, difficulty) {
+    const x = (difficulty - POW_TABLE_MIN) / POW_TABLE_STEP;
+    const i = Math.floor(x);
+    if (i < 0 || i >= POW_TABLE_SIZE - 1) return Math.pow(difficulty, k);
+    return table[i] + (table[i + 1] - table[i]) * (x - i);
+}
 
-    const d = Math.max(digits(a), digits(b));
-    const opW = {'+': 0.0, '-': 0.1, '*': 1.0, '/': 1.2}[op] || 0.5;
+const OP_WEIGHTS = {'+': 0.0, '-': 0.1, '*': 1.0, '/': 1.2};
+
+// decs and maxDigits come from genArithmetic, which knows how it built a and b
+function arithmeticDifficulty(op, decs, maxDigits) {
+    const opW = OP_WEIGHTS[op] || 0.5;
     const decW = 0.25 * decs;
-    const sizeW = 0.2 * Math.max(0, d - 1);
-    return clamp(1.0 + opW + decW + sizeW, 1.0, 6.0);
+    const sizeW = 0.2 * Math.max(0, maxDigits - 1);
+    return Math.min(6.0, Math.max(1.0, 1.0 + opW + decW + sizeW));
 }
 
 function arithmeticTolerance(target, difficulty) {
-    return 0.5 + Math.abs(target) * 0.001 * Math.pow(difficulty, 1.3);
+    return 0.5 + Math.abs(target) * 0.001 * difficultyPow(POW_1_3, 1.3, difficulty);
 }
 
-function unitDifficulty(category, src, dst, value) {
+// Difficulty from the (category, src, dst) triple alone; memoized below
+function unitPairDifficulty(category, src, dst) {
     let base = {'length': 1.6, 'mass': 1.6, 'volume': 1.7, 'temp': 2.4, 'number': 1.8}[category] || 1.8;
 
     let spread = 0.0;
@@ -229,18 +329,34 @@ function unitDifficulty(category, src, dst, value) {
         }
     }
 
-    const mag = Math.log10(Math.max(1.0, Math.abs(value))) * 0.15;
-    return clamp(base + spread + mag, 1.2, 5.0);
+    return base + spread;
+}
+
+// Every (src, dst) pair difficulty per category, tabulated at load
+const UNIT_PAIR_DIFFICULTY = {};
+for (const category of Object.keys(UNITS_BY_CATEGORY)) {
+    UNIT_PAIR_DIFFICULTY[category] = buildPairTable(UNITS_BY_CATEGORY[category],
+        (src, dst) => unitPairDifficulty(category, src, dst));
+}
+
+// 0.15 * log10(x) folded into a single natural-log multiply
+const UNIT_MAGNITUDE_WEIGHT = 0.15 / Math.LN10;
+
+function unitDifficulty(category, src, dst, value) {
+    const pairDiff = pairLookup(UNIT_PAIR_DIFFICULTY[category], src, dst);
+    const absValue = Math.abs(value);
+    const mag = absValue > 1.0 ? Math.log(absValue) * UNIT_MAGNITUDE_WEIGHT : 0.0;
+    return Math.min(5.0, Math.max(1.2, pairDiff + mag));
 }
 
 function unitTolerance(target, difficulty, category) {
     if (category === 'temp') {
-        return 0.5 + 0.01 * Math.abs(target) * Math.pow(difficulty, 1.1);
+        return 0.5 + 0.01 * Math.abs(target) * difficultyPow(POW_1_1, 1.1, difficulty);
     }
-    return 0.5 + 0.005 * Math.abs(target) * Math.pow(difficulty, 1.1);
+    return 0.5 + 0.005 * Math.abs(target) * difficultyPow(POW_1_1, 1.1, difficulty);
 }
 
-function timezoneDifficulty(src, dst) {
+function computeTimezoneDifficulty(src, dst) {
     const offs = Math.abs(TIMEZONES[src] - TIMEZONES[dst]);
     const frac = offs % 60;
     let base = 1.0 + (frac ? 0.6 : 0.0) + (frac === 45 ? 0.3 : 0.0);
@@ -248,45 +364,70 @@ function timezoneDifficulty(src, dst) {
     return clamp(base + dist, 1.0, 3.0);
 }
 
+// Only 8 x 8 zone pairs, so tabulate every difficulty up front
+const TIMEZONE_DIFFICULTY = buildPairTable(TIMEZONE_NAMES, computeTimezoneDifficulty);
+
+function timezoneDifficulty(src, dst) {
+    return pairLookup(TIMEZONE_DIFFICULTY, src, dst);
+}
+
 function timezoneToleranceMinutes(difficulty) {
-    return Math.round(0.5 + 1.5 * Math.pow(difficulty, 1.1));
+    return Math.round(0.5 + 1.5 * difficultyPow(POW_1_1, 1.1, difficulty));
 }
 
 // ============================================
 // SCORING
 // ============================================
 
-function scoreQuestion({ absError, tolerance, difficulty, timeS, mode }) {
+// Pure scalar scoring math; positional numeric args keep it monomorphic.
+// Components are written into `out` and the composite is returned.
+function scoreKernel(absError, tolerance, difficulty, timeS, out) {
     // Difficulty-aware nonlinear accuracy
     const eff = tolerance > 0 ? absError / tolerance : Infinity;
     const gamma = 1.0 + (difficulty - 1.0) / 4.0;
     let acc = 1.0 - Math.pow(eff, gamma);
-    acc = clamp(acc, 0.0, 1.0);
+    acc = Math.min(1.0, Math.max(0.0, acc));
 
     // Speed factor
     const baseDenom = 6.0;
-    const denom = baseDenom * Math.pow(difficulty, 0.8);
+    const denom = baseDenom * difficultyPow(POW_0_8, 0.8, difficulty);
     const spd = 1.0 / (1.0 + (timeS / denom));
 
     // Weighting
-    const wSpeed = clamp(0.5 / Math.sqrt(difficulty), 0.25, 0.5);
+    const wSpeed = Math.min(0.5, Math.max(0.25, 0.5 / Math.sqrt(difficulty)));
     const wAcc = 1.0 - wSpeed;
 
     // Speed-accuracy coupling
     const alpha = 0.2 * ((difficulty - 1.0) / 4.0);
     const spdAccWeight = 0.1 + 0.9 * (alpha + (1.0 - alpha) * acc);
 
-    const composite = wAcc * acc + wSpeed * spd * spdAccWeight;
-    const score = Math.round(100 * composite);
+    out.acc = acc;
+    out.spd = spd;
+    out.wAcc = wAcc;
+    out.wSpeed = wSpeed;
+    out.spdAccWeight = spdAccWeight;
+    return wAcc * acc + wSpeed * spd * spdAccWeight;
+}
+
+const scoreScratch = { acc: 0, spd: 0, wAcc: 0, wSpeed: 0, spdAccWeight: 0 };
+
+// Score only, without the breakdown object; for batch / tuning paths
+function scoreQuestionFast(absError, tolerance, difficulty, timeS) {
+    return Math.round(100 * scoreKernel(absError, tolerance, difficulty, timeS, scoreScratch));
+}
+
+function scoreQuestion({ absError, tolerance, difficulty, timeS, mode }) {
+    const k = scoreScratch;
+    const score = Math.round(100 * scoreKernel(absError, tolerance, difficulty, timeS, k));
 
     return {
         score,
         breakdown: {
-            accuracyFactor: acc,
-            speedFactor: spd,
-            wAcc,
-            wSpeed,
-            spdAccWeight,
+            accuracyFactor: k.acc,
+            speedFactor: k.spd,
+            wAcc: k.wAcc,
+            wSpeed: k.wSpeed,
+            spdAccWeight: k.spdAccWeight,
             tolerance,
             timeS,
         }
@@ -297,71 +438,142 @@ function scoreQuestion({ absError, tolerance, difficulty, timeS, mode }) {
 // PROBLEM GENERATORS
 // ============================================
 
-function genArithmetic(level) {
+// Choice pools for the generators, allocated once rather than per problem
+const OPS_BY_LEVEL = {
+    easy: ['+', '-'],
+    medium: ['+', '-', '*'],
+    hard: ['+', '-', '*', '/'],
+};
+const OP_SYMBOLS = ['+', '-', '*', '/'];
+const OP_INDEX = {'+': 0, '-': 1, '*': 2, '/': 3};
+const OP_FUNCS = {
+    '+': (a, b) => a + b,
+    '-': (a, b) => a - b,
+    '*': (a, b) => a * b,
+    '/': (a, b) => a / b,
+};
+const QUARTER_FRACTIONS = [0.5, 0.25, 0.75];
+const HARD_DECIMAL_PLACES = [1, 1, 2];
+const UNIT_DECIMAL_PLACES = [0, 1, 2];
+const TEMP_DECIMAL_PLACES = [0, 0, 1];
+const TIMEZONE_MINUTES = [0, 5, 10, 15, 20, 30, 35, 40, 45, 50];
+
+// Decimal places left once trailing zeros of a scaled integer are dropped
+function trimmedPlaces(scaled, places) {
+    while (places > 0 && scaled % 10 === 0) {
+        scaled /= 10;
+        places--;
+    }
+    return places;
+}
+
+// Draw one arithmetic item's numbers into `out` (reused, so no allocation)
+function fillArithmetic(level, out) {
     let ops, a, b;
+    let decs = 0;
 
     if (level === 'easy') {
-        ops = ['+', '-'];
+        ops = OPS_BY_LEVEL.easy;
         a = randInt(10, 99);
         b = randInt(10, 99);
     } else if (level === 'medium') {
-        ops = ['+', '-', '*'];
+        ops = OPS_BY_LEVEL.medium;
         a = randInt(20, 350);
         b = randInt(20, 350);
         if (Math.random() < 0.2) {
-            a += randChoice([0.5, 0.25, 0.75]);
-            b += randChoice([0.5, 0.25, 0.75]);
+            const fa = randChoice(QUARTER_FRACTIONS);
+            const fb = randChoice(QUARTER_FRACTIONS);
+            a += fa;
+            b += fb;
+            decs = (fa === 0.5 ? 1 : 2) + (fb === 0.5 ? 1 : 2);
         }
     } else { // hard
-        ops = ['+', '-', '*', '/'];
-        a = roundTo(randFloat(5, 200), randChoice([1, 1, 2]));
-        b = roundTo(randFloat(5, 200), randChoice([1, 1, 2]));
+        ops = OPS_BY_LEVEL.hard;
+        // Same as roundTo(), but keep the scaled integer to count shown decimals
+        const pa = randChoice(HARD_DECIMAL_PLACES);
+        const pb = randChoice(HARD_DECIMAL_PLACES);
+        const na = Math.round(randFloat(5, 200) * Math.pow(10, pa));
+        const nb = Math.round(randFloat(5, 200) * Math.pow(10, pb));
+        a = na / Math.pow(10, pa);
+        b = nb / Math.pow(10, pb);
+        decs = trimmedPlaces(na, pa) + trimmedPlaces(nb, pb);
     }
+    const maxDigits = Math.max(1, Math.floor(Math.log10(Math.max(Math.abs(a), Math.abs(b)) + 1)) + 1);
 
     const op = randChoice(ops);
-    let val;
-    if (op === '+') val = a + b;
-    else if (op === '-') val = a - b;
-    else if (op === '*') val = a * b;
-    else {
-        if (Math.abs(b) < 1e-9) b = 3.0;
-        val = a / b;
-    }
+    if (op === '/' && Math.abs(b) < 1e-9) b = 3.0;
+    const val = OP_FUNCS[op](a, b);
 
-    const diff = arithmeticDifficulty(op, a, b);
+    const diff = arithmeticDifficulty(op, decs, maxDigits);
     let tol = arithmeticTolerance(val, diff);
 
     // Tighten tolerance for simple integer +/−
-    if (['+', '-'].includes(op) && Number.isInteger(a) && Number.isInteger(b)) {
+    if ((op === '+' || op === '-') && Number.isInteger(a) && Number.isInteger(b)) {
         tol = Math.min(tol, 1.5);
     }
 
-    const sA = Number.isInteger(a) ? a.toString() : a.toString();
-    const sB = Number.isInteger(b) ? b.toString() : b.toString();
-    const prompt = `${sA} ${op} ${sB}`;
+    out.op = op;
+    out.a = a;
+    out.b = b;
+    out.value = val;
+    out.difficulty = diff;
+    out.tolerance = tol;
+    return out;
+}
+
+const arithmeticScratch = { op: '+', a: 0, b: 0, value: 0, difficulty: 1, tolerance: 0 };
+
+function genArithmetic(level) {
+    const { op, a, b, value, difficulty, tolerance } = fillArithmetic(level, arithmeticScratch);
+
+    const prompt = `${a} ${op} ${b}`;
 
     return {
         mode: 'arithmetic',
         prompt,
-        correctValue: val,
-        difficulty: diff,
-        tolerance: tol,
+        correctValue: value,
+        difficulty,
+        tolerance,
         answerParser: parseFloat_,
-        errorMetric: (u, t) => Math.abs(u - t),
+        errorMetric: absDiff,
         unitHint: null,
+        category: null,
     };
 }
 
-function genUnitConversion(unitConfig = null) {
-    const allCategories = ['length', 'mass', 'temp', 'volume', 'number'];
+// Generate n arithmetic items as parallel typed arrays (opIndex into
+// OP_SYMBOLS) for calibration / self-play runs that only need the numbers
+function genArithmeticBatch(n, level) {
+    const batch = {
+        opIndex: new Uint8Array(n),
+        a: new Float64Array(n),
+        b: new Float64Array(n),
+        value: new Float64Array(n),
+        difficulty: new Float64Array(n),
+        tolerance: new Float64Array(n),
+    };
+    for (let i = 0; i < n; i++) {
+        const item = fillArithmetic(level, arithmeticScratch);
+        batch.opIndex[i] = OP_INDEX[item.op];
+        batch.a[i] = item.a;
+        batch.b[i] = item.b;
+        batch.value[i] = item.value;
+        batch.difficulty[i] = item.difficulty;
+        batch.tolerance[i] = item.tolerance;
+    }
+    return batch;
+}
 
+const UNIT_CATEGORIES = ['length', 'mass', 'temp', 'volume', 'number'];
+
+function genUnitConversion(unitConfig = null) {
     // Filter to enabled categories
-    let categories = allCategories;
+    let categories = UNIT_CATEGORIES;
     if (unitConfig && unitConfig.enabledCategories) {
-        categories = allCategories.filter(c => unitConfig.enabledCategories.has(c));
+        categories = UNIT_CATEGORIES.filter(c => unitConfig.enabledCategories.has(c));
     }
     if (categories.length === 0) {
-        categories = allCategories;
+        categories = UNIT_CATEGORIES;
     }
 
     const cat = randChoice(categories);
@@ -369,39 +581,34 @@ function genUnitConversion(unitConfig = null) {
     let units, value, target, src, dst;
 
     if (cat === 'length') {
-        let allUnits = Object.keys(LENGTH_FACTORS);
         units = getUnitsForCategory(cat, unitConfig);
-        if (units.length < 2) units = allUnits;
-        [src, dst] = randSample(units, 2);
-        value = roundTo(randFloat(0.5, 5000), randChoice([0, 1, 2]));
+        if (units.length < 2) units = UNITS_BY_CATEGORY[cat];
+        [src, dst] = randPair(units);
+        value = roundTo(randFloat(0.5, 5000), randChoice(UNIT_DECIMAL_PLACES));
         target = convertLength(value, src, dst);
     } else if (cat === 'mass') {
-        let allUnits = Object.keys(MASS_FACTORS);
         units = getUnitsForCategory(cat, unitConfig);
-        if (units.length < 2) units = allUnits;
-        [src, dst] = randSample(units, 2);
-        value = roundTo(randFloat(0.5, 500), randChoice([0, 1, 2]));
+        if (units.length < 2) units = UNITS_BY_CATEGORY[cat];
+        [src, dst] = randPair(units);
+        value = roundTo(randFloat(0.5, 500), randChoice(UNIT_DECIMAL_PLACES));
         target = convertMass(value, src, dst);
     } else if (cat === 'volume') {
-        let allUnits = Object.keys(VOLUME_FACTORS);
         units = getUnitsForCategory(cat, unitConfig);
-        if (units.length < 2) units = allUnits;
-        [src, dst] = randSample(units, 2);
-        value = roundTo(randFloat(0.5, 200), randChoice([0, 1, 2]));
+        if (units.length < 2) units = UNITS_BY_CATEGORY[cat];
+        [src, dst] = randPair(units);
+        value = roundTo(randFloat(0.5, 200), randChoice(UNIT_DECIMAL_PLACES));
         target = convertVolume(value, src, dst);
     } else if (cat === 'temp') {
-        let allUnits = TEMP_UNITS;
         units = getUnitsForCategory(cat, unitConfig);
-        if (units.length < 2) units = allUnits;
-        [src, dst] = randSample(units, 2);
-        value = roundTo(randFloat(-40, 150), randChoice([0, 0, 1]));
+        if (units.length < 2) units = UNITS_BY_CATEGORY[cat];
+        [src, dst] = randPair(units);
+        value = roundTo(randFloat(-40, 150), randChoice(TEMP_DECIMAL_PLACES));
         target = convertTemp(value, src, dst);
     } else { // number
-        let allUnits = Object.keys(NUMBER_FACTORS);
         units = getUnitsForCategory(cat, unitConfig);
-        if (units.length < 2) units = allUnits;
-        [src, dst] = randSample(units, 2);
-        value = roundTo(randFloat(0.5, 500), randChoice([0, 1, 2]));
+        if (units.length < 2) units = UNITS_BY_CATEGORY[cat];
+        [src, dst] = randPair(units);
+        value = roundTo(randFloat(0.5, 500), randChoice(UNIT_DECIMAL_PLACES));
         target = convertNumber(value, src, dst);
     }
 
@@ -416,17 +623,16 @@ function genUnitConversion(unitConfig = null) {
         difficulty: diff,
         tolerance: tol,
         answerParser: parseFloat_,
-        errorMetric: (u, t) => Math.abs(u - t),
+        errorMetric: absDiff,
         unitHint: dst,
         category: cat,
     };
 }
 
 function genTimezone() {
-    const zones = Object.keys(TIMEZONES);
-    const [src, dst] = randSample(zones, 2);
+    const [src, dst] = randPair(TIMEZONE_NAMES);
     const hh = randInt(1, 22);
-    const mm = randChoice([0, 5, 10, 15, 20, 30, 35, 40, 45, 50]);
+    const mm = randChoice(TIMEZONE_MINUTES);
     const srcMin = hh * 60 + mm;
     const targetMin = convertTimezone(srcMin, src, dst);
     const diff = timezoneDifficulty(src, dst);
@@ -440,8 +646,9 @@ function genTimezone() {
         difficulty: diff,
         tolerance: tol,
         answerParser: parseHHMM,
-        errorMetric: (u, t) => Math.min(Math.abs(u - t), 1440 - Math.abs(u - t)),
+        errorMetric: minuteDiff,
         unitHint: '24h HH:MM',
+        category: null,
     };
 }
 
@@ -452,6 +659,10 @@ function genMixed(level, unitConfig = null) {
     return genTimezone();
 }
 
+// Every generator returns the same fields in the same order (mode, prompt,
+// correctValue, difficulty, tolerance, answerParser, errorMetric, unitHint,
+// category), so problems share one object shape and reads like
+// prob.unitHint never need an existence check
 function makeProblem(mode, level, unitConfig = null) {
     if (mode === 'arithmetic') return genArithmetic(level);
     if (mode === 'unit') return genUnitConversion(unitConfig);
@@ -463,6 +674,24 @@ function makeProblem(mode, level, unitConfig = null) {
 // GAME STATE
 // ============================================
 
+// Per-round results stored column-wise: one array per field, indexed by
+// round. Numeric columns are typed arrays sized for the session up front;
+// `count` is the number of rounds recorded so far.
+function createResults(rounds) {
+    return {
+        count: 0,
+        prompt: [],
+        answer: [],
+        mode: [],
+        correct: new Float64Array(rounds),
+        absError: new Float64Array(rounds),
+        score: new Int16Array(rounds),
+        timeS: new Float64Array(rounds),
+        difficulty: new Float64Array(rounds),
+        tolerance: new Float64Array(rounds),
+    };
+}
+
 const GameState = {
     mode: 'arithmetic',
     level: 'medium',
@@ -470,13 +699,13 @@ const GameState = {
     currentRound: 0,
     totalScore: 0,
     currentProblem: null,
+    awaitingAnswer: false,
+    problemQueue: [],
     startTime: 0,
-    timerInterval: null,
-    unitConfig: {
-        enabledCategories: new Set(['length', 'mass', 'volume', 'temp', 'number']),
-        allowedUnits: {},
-    },
-    results: [],
+    timerId: null,
+    timerPaintPending: false,
+    unitConfig: makeUnitConfig(new Set(['length', 'mass', 'volume', 'temp', 'number']), {}),
+    results: createResults(0),
 };
 
 // ============================================
@@ -509,7 +738,11 @@ const elements = {
     submitBtn: document.getElementById('submit-btn'),
     feedbackContainer: document.getElementById('feedback-container'),
     feedbackResult: document.getElementById('feedback-result'),
-    feedbackDetails: document.getElementById('feedback-details'),
+    feedbackCorrect: document.getElementById('feedback-correct'),
+    feedbackError: document.getElementById('feedback-error'),
+    feedbackAcc: document.getElementById('feedback-acc'),
+    feedbackSpd: document.getElementById('feedback-spd'),
+    feedbackTime: document.getElementById('feedback-time'),
     nextBtn: document.getElementById('next-btn'),
     quitBtn: document.getElementById('quit-btn'),
 
@@ -529,25 +762,50 @@ const elements = {
 // UI FUNCTIONS
 // ============================================
 
+// Write a label only when its text actually changes, to avoid needless reflow
+function setText(el, text) {
+    text = String(text);
+    if (el.textContent !== text) el.textContent = text;
+}
+
+const screens = {
+    'start-screen': elements.startScreen,
+    'game-screen': elements.gameScreen,
+    'results-screen': elements.resultsScreen,
+};
+let activeScreen = elements.startScreen;
+
+// Only the outgoing and incoming screens change class, so a transition is
+// one style invalidation pair rather than a sweep over every screen
 function showScreen(screenId) {
-    document.querySelectorAll('.screen').forEach(screen => {
-        screen.classList.remove('active');
-    });
-    document.getElementById(screenId).classList.add('active');
+    const next = screens[screenId];
+    if (next === activeScreen) return;
+    activeScreen.classList.remove('active');
+    next.classList.add('active');
+    activeScreen = next;
 }
 
+const DIFFICULTY_DESCRIPTIONS = {
+    easy: '2-digit addition & subtraction',
+    medium: 'Mix of operators with some 3-digit numbers',
+    hard: 'Division, decimals, and larger numbers',
+};
+
 function updateDifficultyDescription() {
-    const descriptions = {
-        easy: '2-digit addition & subtraction',
-        medium: 'Mix of operators with some 3-digit numbers',
-        hard: 'Division, decimals, and larger numbers',
-    };
-    elements.diffDescription.textContent = descriptions[GameState.level];
+    elements.diffDescription.textContent = DIFFICULTY_DESCRIPTIONS[GameState.level];
 }
 
+// The unit settings panel starts hidden, so its listeners are only wired
+// the first time it is shown
+let unitSettingsReady = false;
+
 function updateUnitSettingsVisibility() {
     if (elements.unitSettingsGroup) {
         if (GameState.mode === 'unit' || GameState.mode === 'mixed') {
+            if (!unitSettingsReady) {
+                initUnitSettings();
+                unitSettingsReady = true;
+            }
             elements.unitSettingsGroup.style.display = 'block';
         } else {
             elements.unitSettingsGroup.style.display = 'none';
@@ -556,21 +814,19 @@ function updateUnitSettingsVisibility() {
 }
 
 function collectUnitConfig() {
-    const config = {
-        enabledCategories: new Set(),
-        allowedUnits: {},
-    };
+    const enabledCategories = new Set();
+    const allowedUnits = {};
 
     // Collect enabled categories
     document.querySelectorAll('.category-checkbox').forEach(cb => {
         const category = cb.dataset.category;
         if (cb.checked) {
-            config.enabledCategories.add(category);
+            enabledCategories.add(category);
 
             // Collect allowed units for this category
             const unitCheckboxes = document.querySelectorAll(`#units-${category} input[type="checkbox"]:checked`);
             if (unitCheckboxes.length > 0) {
-                config.allowedUnits[category] = new Set(
+                allowedUnits[category] = new Set(
                     Array.from(unitCheckboxes).map(u => u.value)
                 );
             }
@@ -578,11 +834,11 @@ function collectUnitConfig() {
     });
 
     // Fallback to all if none selected
-    if (config.enabledCategories.size === 0) {
-        config.enabledCategories = new Set(['length', 'mass', 'volume', 'temp', 'number']);
+    if (enabledCategories.size === 0) {
+        UNIT_CATEGORIES.forEach(c => enabledCategories.add(c));
     }
 
-    return config;
+    return makeUnitConfig(enabledCategories, allowedUnits);
 }
 
 function initUnitSettings() {
@@ -612,33 +868,83 @@ function initUnitSettings() {
     });
 }
 
-function startTimer() {
-    GameState.startTime = Date.now();
-    elements.timer.textContent = '0.0s';
+const TIMER_TICK_MS = 200;
 
-    if (GameState.timerInterval) {
-        clearInterval(GameState.timerInterval);
+// Ticks keep the cadence; the label write is deferred to the next animation
+// frame, so it coalesces with other rendering and is skipped in hidden tabs
+function tickTimer() {
+    const elapsedMs = performance.now() - GameState.startTime;
+    if (!GameState.timerPaintPending) {
+        GameState.timerPaintPending = true;
+        requestAnimationFrame(paintTimer);
     }
+    // Aim the next tick at the 200 ms grid so late callbacks don't accumulate drift
+    GameState.timerId = setTimeout(tickTimer, Math.max(50, TIMER_TICK_MS - elapsedMs % TIMER_TICK_MS));
+}
 
-    GameState.timerInterval = setInterval(() => {
-        const elapsed = (Date.now() - GameState.startTime) / 1000;
-        elements.timer.textContent = `${elapsed.toFixed(1)}s`;
-    }, 100);
+function paintTimer() {
+    GameState.timerPaintPending = false;
+    // The question may have been answered since this paint was requested
+    if (GameState.timerId === null) return;
+    const elapsedMs = performance.now() - GameState.startTime;
+    setText(elements.timer, `${(elapsedMs / 1000).toFixed(1)}s`);
 }
 
-function stopTimer() {
-    if (GameState.timerInterval) {
-        clearInterval(GameState.timerInterval);
-        GameState.timerInterval = null;
+// timerId is non-null exactly while a tick is pending, so it doubles as the
+// running flag and clearTimeout is only called when there is something to cancel
+function cancelTimer() {
+    if (GameState.timerId !== null) {
+        clearTimeout(GameState.timerId);
+        GameState.timerId = null;
     }
-    return (Date.now() - GameState.startTime) / 1000;
+}
+
+function startTimer() {
+    cancelTimer();
+    GameState.startTime = performance.now();
+    setText(elements.timer, '0.0s');
+    GameState.timerId = setTimeout(tickTimer, TIMER_TICK_MS);
+}
+
+function stopTimer() {
+    cancelTimer();
+    return (performance.now() - GameState.startTime) / 1000;
+}
+
+// requestIdleCallback is missing in some browsers (Safari); fall back to a
+// short timeout whose deadline counts down an 8 ms budget
+const scheduleIdle = window.requestIdleCallback
+    ? cb => window.requestIdleCallback(cb)
+    : cb => setTimeout(() => {
+        const start = performance.now();
+        cb({ timeRemaining: () => Math.max(0, 8 - (performance.now() - start)) });
+    }, 1);
+
+// Generate the session's problems ahead of time in idle slices, so moving
+// to the next question is a queue pop rather than generation work
+function prefillProblems(count) {
+    const queue = [];
+    GameState.problemQueue = queue;
+    // Rounds already started plus queued problems; inline fallbacks count too
+    const covered = () => GameState.currentRound + queue.length;
+    const fill = (deadline) => {
+        // A newer session replaced this queue; stop filling it
+        if (GameState.problemQueue !== queue) return;
+        while (covered() < count && deadline.timeRemaining() > 1) {
+            queue.push(makeProblem(GameState.mode, GameState.level, GameState.unitConfig));
+        }
+        if (covered() < count) scheduleIdle(fill);
+    };
+    scheduleIdle(fill);
 }
 
 function resetGame() {
     GameState.currentRound = 0;
     GameState.totalScore = 0;
-    GameState.results = [];
+    GameState.results = createResults(GameState.totalRounds);
     GameState.currentProblem = null;
+    GameState.awaitingAnswer = false;
+    prefillProblems(GameState.totalRounds);
 }
 
 function nextQuestion() {
@@ -648,79 +954,112 @@ function nextQuestion() {
     }
 
     GameState.currentRound++;
-    GameState.currentProblem = makeProblem(GameState.mode, GameState.level, GameState.unitConfig);
+    // Fall back to generating inline if the idle prefill hasn't caught up
+    GameState.currentProblem = GameState.problemQueue.shift()
+        || makeProblem(GameState.mode, GameState.level, GameState.unitConfig);
+    renderQuestion();
+    GameState.awaitingAnswer = true;
+    startTimer();
+}
 
-    // Update UI
-    elements.progressText.textContent = `${GameState.currentRound} / ${GameState.totalRounds}`;
+// Apply every per-question DOM write in one run with no layout reads in
+// between, so the browser does a single style/layout pass for the change.
+// focus() is last since it is the only call that may need layout.
+function renderQuestion() {
+    const prob = GameState.currentProblem;
+    const mode = prob.mode;
+    setText(elements.progressText, `${GameState.currentRound} / ${GameState.totalRounds}`);
     elements.progressFill.style.width = `${(GameState.currentRound / GameState.totalRounds) * 100}%`;
-    elements.currentScore.textContent = GameState.totalScore;
-    elements.problemPrompt.textContent = GameState.currentProblem.prompt;
+    setText(elements.currentScore, GameState.totalScore);
+    elements.problemPrompt.textContent = prob.prompt;
 
     // Set hint
-    if (GameState.currentProblem.mode === 'unit' && GameState.currentProblem.unitHint) {
-        elements.problemHint.textContent = `Answer in ${GameState.currentProblem.unitHint}`;
-    } else if (GameState.currentProblem.mode === 'timezone') {
-        elements.problemHint.textContent = 'Format: HH:MM or HH.MM (24-hour)';
-    } else {
-        elements.problemHint.textContent = '';
+    let hint = '';
+    if (mode === 'unit' && prob.unitHint) {
+        hint = `Answer in ${prob.unitHint}`;
+    } else if (mode === 'timezone') {
+        hint = 'Format: HH:MM or HH.MM (24-hour)';
     }
+    setText(elements.problemHint, hint);
 
     // Reset input and feedback
     elements.answerInput.value = '';
     elements.answerInput.disabled = false;
     elements.submitBtn.disabled = false;
     elements.feedbackContainer.classList.add('hidden');
+    elements.answerInput.addEventListener('keypress', onAnswerKeypress);
     elements.answerInput.focus();
+}
 
-    startTimer();
+// 6 significant digits with trailing fractional zeros dropped; zeros in the
+// integer part (e.g. 120000) are kept
+function fmtAnswerNumber(value) {
+    const s = value.toPrecision(6);
+    return s.includes('.') && !s.includes('e') ? s.replace(/\.?0+$/, '') : s;
+}
+
+// Correct-answer display per problem mode; anything else is numeric
+const CORRECT_FORMATTERS = {
+    timezone: fmtHHMM,
+};
+
+function onAnswerKeypress(e) {
+    if (e.key === 'Enter') {
+        submitAnswer();
+    }
 }
 
 function submitAnswer() {
-    if (!GameState.currentProblem || elements.answerInput.disabled) return;
+    // Exactly one scoring pass per question: repeat Enter presses or clicks
+    // after the first are dropped before any parsing or DOM work
+    if (!GameState.awaitingAnswer) return;
+    GameState.awaitingAnswer = false;
+    // Nothing to submit until the next question; stray Enters are not even dispatched
+    elements.answerInput.removeEventListener('keypress', onAnswerKeypress);
+    const prob = GameState.currentProblem;
+    const mode = prob.mode;
 
     const timeS = stopTimer();
     const answerStr = elements.answerInput.value.trim();
 
     // Parse and calculate error
-    const parsed = GameState.currentProblem.answerParser(answerStr);
+    const parsed = prob.answerParser(answerStr);
     let absError;
     if (parsed === null) {
         absError = Infinity;
     } else {
-        absError = GameState.currentProblem.errorMetric(parsed, GameState.currentProblem.correctValue);
+        absError = prob.errorMetric(parsed, prob.correctValue);
     }
 
     // Calculate score
-    const { score, breakdown } = scoreQuestion({
+    const { score, breakdown: { accuracyFactor, speedFactor } } = scoreQuestion({
         absError,
-        tolerance: GameState.currentProblem.tolerance,
-        difficulty: GameState.currentProblem.difficulty,
+        tolerance: prob.tolerance,
+        difficulty: prob.difficulty,
         timeS,
-        mode: GameState.currentProblem.mode,
+        mode,
     });
 
     GameState.totalScore += score;
-    elements.currentScore.textContent = GameState.totalScore;
+    setText(elements.currentScore, GameState.totalScore);
     elements.currentScore.classList.add('updating');
     setTimeout(() => elements.currentScore.classList.remove('updating'), 300);
 
     // Store result
-    GameState.results.push({
-        prompt: GameState.currentProblem.prompt,
-        answer: answerStr,
-        correct: GameState.currentProblem.correctValue,
-        absError,
-        score,
-        timeS,
-        difficulty: GameState.currentProblem.difficulty,
-        tolerance: GameState.currentProblem.tolerance,
-        mode: GameState.currentProblem.mode,
-    });
+    const results = GameState.results;
+    const i = results.count++;
+    results.prompt.push(prob.prompt);
+    results.answer.push(answerStr);
+    results.mode.push(mode);
+    results.correct[i] = prob.correctValue;
+    results.absError[i] = absError;
+    results.score[i] = score;
+    results.timeS[i] = timeS;
+    results.difficulty[i] = prob.difficulty;
+    results.tolerance[i] = prob.tolerance;
 
     // Show feedback
-    const correctDisplay = GameState.currentProblem.mode === 'timezone'
-        ? fmtHHMM(GameState.currentProblem.correctValue)
-        : GameState.currentProblem.correctValue.toPrecision(6).replace(/\.?0+$/, '');
+    const correctDisplay = (CORRECT_FORMATTERS[mode] || fmtAnswerNumber)(prob.correctValue);
 
     const errorDisplay = isFinite(absError) ? absError.toPrecision(3) : 'n/a';
 
@@ -739,10 +1078,12 @@ function submitAnswer() {
 
     elements.feedbackResult.className = `feedback-result ${feedbackClass}`;
     elements.feedbackResult.textContent = feedbackText;
-    elements.feedbackDetails.innerHTML = `
-        Correct: <strong>${correctDisplay}</strong> | Your error: ${errorDisplay}<br>
-        acc ×${breakdown.accuracyFactor.toFixed(2)} | spd ×${breakdown.speedFactor.toFixed(2)} | ${timeS.toFixed(2)}s
-    `;
+    // Feedback markup is static in index.html; only the text nodes change
+    elements.feedbackCorrect.textContent = correctDisplay;
+    elements.feedbackError.textContent = errorDisplay;
+    elements.feedbackAcc.textContent = accuracyFactor.toFixed(2);
+    elements.feedbackSpd.textContent = speedFactor.toFixed(2);
+    elements.feedbackTime.textContent = timeS.toFixed(2);
 
     // Update button text
     elements.nextBtn.textContent = GameState.currentRound >= GameState.totalRounds ? 'See Results' : 'Next Question';
@@ -772,25 +1113,34 @@ function showResults() {
     elements.scoreRating.textContent = rating;
 
     // Calculate stats
-    if (GameState.results.length > 0) {
-        const avgTime = GameState.results.reduce((sum, r) => sum + r.timeS, 0) / GameState.results.length;
+    const { count, prompt, score, timeS } = GameState.results;
+    if (count > 0) {
+        let timeSum = 0;
+        let accurateCount = 0;
+        let bestScore = -Infinity;
+        for (let i = 0; i < count; i++) {
+            timeSum += timeS[i];
+            if (score[i] >= 70) accurateCount++;
+            if (score[i] > bestScore) bestScore = score[i];
+        }
+
+        const avgTime = timeSum / count;
         elements.avgTime.textContent = `${avgTime.toFixed(1)}s`;
 
-        const accurateCount = GameState.results.filter(r => r.score >= 70).length;
-        const accuracyRate = (accurateCount / GameState.results.length) * 100;
+        const accuracyRate = (accurateCount / count) * 100;
         elements.accuracyRate.textContent = `${Math.round(accuracyRate)}%`;
 
-        const bestScore = Math.max(...GameState.results.map(r => r.score));
         elements.bestScore.textContent = bestScore;
     }
 
     // Build breakdown list
-    elements.breakdownList.innerHTML = GameState.results.map((r, i) => {
-        const scoreClass = r.score >= 70 ? 'high' : r.score >= 40 ? 'medium' : 'low';
+    elements.breakdownList.innerHTML = prompt.map((p, i) => {
+        const s = score[i];
+        const scoreClass = s >= 70 ? 'high' : s >= 40 ? 'medium' : 'low';
         return `
             <div class="breakdown-item">
-                <span class="breakdown-prompt">${i + 1}. ${r.prompt}</span>
-                <span class="breakdown-score ${scoreClass}">${r.score}</span>
+                <span class="breakdown-prompt">${i + 1}. ${p}</span>
+                <span class="breakdown-score ${scoreClass}">${s}</span>
             </div>
         `;
     }).join('');
@@ -829,12 +1179,14 @@ elements.diffButtons.forEach(btn => {
     });
 });
 
-// Question count selection
+// Question count selection; counts are fixed per button, so parse and
+// bound them once here and the start flow never sees an invalid value
 elements.questionButtons.forEach(btn => {
+    const count = clamp(parseInt(btn.dataset.count, 10) || 10, 1, 100);
     btn.addEventListener('click', () => {
         elements.questionButtons.forEach(b => b.classList.remove('active'));
         btn.classList.add('active');
-        GameState.totalRounds = parseInt(btn.dataset.count, 10);
+        GameState.totalRounds = count;
     });
 });
 
@@ -847,13 +1199,9 @@ elements.startBtn.addEventListener('click', () => {
     nextQuestion();
 });
 
-// Submit answer
+// Submit answer (the Enter key handler is attached per question, see
+// renderQuestion / submitAnswer)
 elements.submitBtn.addEventListener('click', submitAnswer);
-elements.answerInput.addEventListener('keypress', (e) => {
-    if (e.key === 'Enter') {
-        submitAnswer();
-    }
-});
 
 // Next question
 elements.nextBtn.addEventListener('click', () => {
@@ -866,7 +1214,10 @@ elements.nextBtn.addEventListener('click', () => {
 
 // Quit game
 elements.quitBtn.addEventListener('click', () => {
-    stopTimer();
+    cancelTimer();
+    GameState.awaitingAnswer = false;
+    // Detach the queue so a pending prefill stops on its next slice
+    GameState.problemQueue = [];
     showScreen('start-screen');
 });
 
@@ -884,4 +1235,3 @@ elements.changeSettingsBtn.addEventListener('click', () => {
 
 // Initialize
 updateDifficultyDescription();
-initUnitSettings();